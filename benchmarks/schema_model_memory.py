@@ -0,0 +1,116 @@
+"""
+Schema Model Memory Benchmark
+
+Compares the memory footprint of a raw json.load() schema against the
+indexed schema model for a synthetic 10k-table schema.
+Usage: python benchmarks/schema_model_memory.py [table_count]
+"""
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lib'))
+
+from schema_model import Schema
+
+
+COLUMN_TYPES = ['integer', 'character varying', 'text', 'boolean',
+                'timestamp with time zone', 'numeric', 'jsonb']
+
+
+def generate_schema_json(table_count: int, seed: int = 0) -> str:
+    """
+    Generate a synthetic schema in the extractor JSON format.
+    
+    Each table has an id primary key, 5-20 columns and up to three foreign
+    keys to earlier tables, roughly matching a large production database.
+    
+    Args:
+        table_count: Number of tables to generate
+        seed: Random seed for reproducible output
+        
+    Returns:
+        Schema JSON text
+    """
+    rng = random.Random(seed)
+    tables = []
+    for i in range(table_count):
+        name = f"table_{i}"
+        columns = [{'column_name': 'id', 'data_type': 'integer', 'is_nullable': 'NO'}]
+        constraints = [{
+            'constraint_name': f"{name}_pkey",
+            'constraint_type': 'PRIMARY KEY',
+            'column_name': 'id',
+            'foreign_table_schema': 'public',
+            'foreign_table_name': name,
+            'foreign_column_name': 'id'
+        }]
+        for j in range(rng.randint(5, 20)):
+            columns.append({
+                'column_name': f"column_{j}",
+                'data_type': rng.choice(COLUMN_TYPES),
+                'is_nullable': rng.choice(['YES', 'NO'])
+            })
+        for _ in range(rng.randint(0, 3) if i else 0):
+            target = f"table_{rng.randrange(i)}"
+            columns.append({'column_name': f"{target}_id", 'data_type': 'integer', 'is_nullable': 'YES'})
+            constraints.append({
+                'constraint_name': f"{name}_{target}_fkey",
+                'constraint_type': 'FOREIGN KEY',
+                'column_name': f"{target}_id",
+                'foreign_table_schema': 'public',
+                'foreign_table_name': target,
+                'foreign_column_name': 'id'
+            })
+        tables.append({'schema': 'public', 'name': name, 'columns': columns, 'constraints': constraints})
+    
+    return json.dumps({
+        'database_info': {'database_name': 'benchmark', 'database_type': 'postgres'},
+        'tables': tables
+    })
+
+
+def measure(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """
+    Measure the memory retained by the object returned from build().
+    
+    Args:
+        build: Function creating the object to measure
+        
+    Returns:
+        Tuple of (built object, retained bytes)
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained
+
+
+def main():
+    """Run the benchmark and print a comparison."""
+    table_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    schema_text = generate_schema_json(table_count)
+    
+    raw, raw_bytes = measure(lambda: json.loads(schema_text))
+    del raw
+    
+    # Only the model is kept alive; the parsed dicts are discarded after the build
+    model, model_bytes = measure(lambda: Schema.from_dict(json.loads(schema_text)))
+    
+    print(f"Tables:        {len(model.tables)}")
+    print(f"Relationships: {len(model.relationships)}")
+    print(f"Raw JSON dicts: {raw_bytes / 1024 / 1024:8.1f} MiB")
+    print(f"Schema model:   {model_bytes / 1024 / 1024:8.1f} MiB")
+    print(f"Reduction:      {100 * (1 - model_bytes / raw_bytes):8.1f}%")
+
+
+if __name__ == '__main__':
+    main()
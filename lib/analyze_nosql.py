@@ -2,6 +2,8 @@ import json
 import sys
 import os
 
+from schema_model import Column, Constraint, Table
+
 def main():
     file_name = sys.argv[1]
     collection_name = os.path.basename(file_name).replace(".json", "")
@@ -34,29 +36,18 @@ def main():
             elif current_type not in types[field]:
                 types[field] += f", {current_type}"
 
-    output = {
-        "schema": "public",
-        "name": collection_name,
-        "columns": [],
-        "constraints": []
-    }
-
-    for field, dtype in types.items():
-        output["columns"].append({
-            "column_name": field,
-            "data_type": dtype,
-            "is_nullable": "YES" if field == "_id" else "NO"
-        })
-    
-    for field, constraint_type in constraints.items():
-        output["constraints"].append({
-            "constraint_name": f"{collection_name}_pkey",
-            "constraint_type": "PRIMARY KEY",
-            "column_name": field,
-            "foreign_table_schema": "public",
-            "foreign_table_name": collection_name,
-            "foreign_column_name": field
-        })
+    # the model is only used as a shared serializer here, so collection output
+    # stays in the same format visualize.py reads
+    columns = tuple(
+        Column(field, dtype, field == "_id", position)
+        for position, (field, dtype) in enumerate(types.items())
+    )
+    table_constraints = tuple(
+        Constraint(f"{collection_name}_pkey", constraint_type, field,
+                   "public", collection_name, field)
+        for field, constraint_type in constraints.items()
+    )
+    output = Table(collection_name, "public", columns, table_constraints).to_dict()
 
     json.dump(output, sys.stdout, indent=4)
     print()  # Ensure newline after each block
@@ -0,0 +1,214 @@
+"""
+Compact in-memory model of extracted database schemas.
+
+Builds typed, indexed objects from the JSON format written by the database
+extractors so consumers don't have to rescan nested dicts. All classes use
+__slots__ and all names are interned, which keeps the footprint of schemas
+with thousands of tables well below that of the raw parsed JSON.
+"""
+
+import sys
+from typing import Dict, List, Any, Optional, FrozenSet, Tuple
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a string from the schema JSON, passing None through."""
+    return sys.intern(value) if value is not None else None
+
+
+class Column:
+    """A single table column."""
+
+    __slots__ = ('name', 'data_type', 'is_nullable', 'position')
+
+    def __init__(self, name: str, data_type: str, is_nullable: bool, position: int):
+        self.name = sys.intern(name)
+        self.data_type = sys.intern(data_type)
+        self.is_nullable = is_nullable
+        self.position = position
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the extractor JSON format."""
+        return {
+            'column_name': self.name,
+            'data_type': self.data_type,
+            'is_nullable': 'YES' if self.is_nullable else 'NO'
+        }
+
+
+class Constraint:
+    """A table constraint, one row per constrained column."""
+
+    __slots__ = ('name', 'constraint_type', 'column_name', 'foreign_table_schema',
+                 'foreign_table_name', 'foreign_column_name')
+
+    def __init__(self, name: str, constraint_type: str, column_name: Optional[str],
+                 foreign_table_schema: Optional[str] = None,
+                 foreign_table_name: Optional[str] = None,
+                 foreign_column_name: Optional[str] = None):
+        self.name = sys.intern(name)
+        self.constraint_type = sys.intern(constraint_type)
+        self.column_name = _intern(column_name)
+        self.foreign_table_schema = _intern(foreign_table_schema)
+        self.foreign_table_name = _intern(foreign_table_name)
+        self.foreign_column_name = _intern(foreign_column_name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the extractor JSON format."""
+        return {
+            'constraint_name': self.name,
+            'constraint_type': self.constraint_type,
+            'column_name': self.column_name,
+            'foreign_table_schema': self.foreign_table_schema,
+            'foreign_table_name': self.foreign_table_name,
+            'foreign_column_name': self.foreign_column_name
+        }
+
+
+class Relationship:
+    """A foreign key edge between two tables that both exist in the schema."""
+
+    __slots__ = ('from_table', 'from_column', 'to_table', 'to_column')
+
+    def __init__(self, from_table: 'Table', from_column: str,
+                 to_table: 'Table', to_column: str):
+        self.from_table = from_table
+        self.from_column = from_column
+        self.to_table = to_table
+        self.to_column = to_column
+
+
+class Table:
+    """A table with its columns, constraints and precomputed key indexes."""
+
+    __slots__ = ('schema', 'name', 'columns', 'columns_by_name', 'constraints',
+                 'primary_keys', 'foreign_keys', 'outbound', 'inbound')
+
+    def __init__(self, name: str, schema: Optional[str] = None,
+                 columns: Tuple[Column, ...] = (),
+                 constraints: Tuple[Constraint, ...] = ()):
+        self.schema = _intern(schema)
+        self.name = sys.intern(name)
+        self.columns = tuple(columns)
+        self.columns_by_name = {column.name: column for column in self.columns}
+        self.constraints = tuple(constraints)
+        self.primary_keys: FrozenSet[str] = frozenset(
+            c.column_name for c in self.constraints
+            if c.constraint_type == 'PRIMARY KEY' and c.column_name
+        )
+        self.foreign_keys: FrozenSet[str] = frozenset(
+            c.column_name for c in self.constraints
+            if c.constraint_type == 'FOREIGN KEY' and c.column_name
+        )
+        # Filled in by Schema once every table is known
+        self.outbound: List[Relationship] = []
+        self.inbound: List[Relationship] = []
+
+    @classmethod
+    def from_dict(cls, table_data: Dict[str, Any]) -> 'Table':
+        """
+        Build a table from the extractor JSON format.
+
+        Args:
+            table_data: Table schema dictionary
+
+        Returns:
+            Table instance
+        """
+        columns = tuple(
+            Column(column['column_name'], column['data_type'],
+                   column['is_nullable'] != 'NO', position)
+            for position, column in enumerate(table_data['columns'])
+        )
+        constraints = tuple(
+            Constraint(constraint['constraint_name'],
+                       constraint['constraint_type'],
+                       constraint.get('column_name'),
+                       constraint.get('foreign_table_schema'),
+                       constraint.get('foreign_table_name'),
+                       constraint.get('foreign_column_name'))
+            for constraint in table_data.get('constraints') or ()
+        )
+        return cls(table_data['name'], table_data.get('schema'), columns, constraints)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the extractor JSON format."""
+        return {
+            'schema': self.schema,
+            'name': self.name,
+            'columns': [column.to_dict() for column in self.columns],
+            'constraints': [constraint.to_dict() for constraint in self.constraints]
+        }
+
+
+class Schema:
+    """A whole database schema with indexed tables and resolved relationships."""
+
+    __slots__ = ('database_name', 'database_type', 'tables', 'tables_by_key',
+                 'tables_by_name', 'relationships')
+
+    def __init__(self, database_name: str, database_type: Optional[str] = None,
+                 tables: Tuple[Table, ...] = ()):
+        self.database_name = sys.intern(database_name)
+        self.database_type = _intern(database_type)
+        self.tables = tuple(tables)
+        self.tables_by_key: Dict[Tuple[Optional[str], str], Table] = {
+            (table.schema, table.name): table for table in self.tables
+        }
+        # The same name can exist in several database schemas (e.g. public.users and auth.users)
+        self.tables_by_name: Dict[str, List[Table]] = {}
+        for table in self.tables:
+            self.tables_by_name.setdefault(table.name, []).append(table)
+        self.relationships: List[Relationship] = []
+
+        # Only keep foreign keys whose target table is part of the schema
+        for table in self.tables:
+            for constraint in table.constraints:
+                if constraint.constraint_type != 'FOREIGN KEY':
+                    continue
+                target = self.find_table(constraint.foreign_table_name,
+                                         constraint.foreign_table_schema)
+                if target is None:
+                    continue
+                relationship = Relationship(table, constraint.column_name,
+                                            target, constraint.foreign_column_name)
+                self.relationships.append(relationship)
+                table.outbound.append(relationship)
+                target.inbound.append(relationship)
+
+    def find_table(self, name: Optional[str], schema: Optional[str] = None) -> Optional[Table]:
+        """
+        Look up a table by database schema and name.
+
+        Falls back to the bare name when there is no exact match, as long as
+        only one table has that name.
+
+        Args:
+            name: Table name
+            schema: Database schema the table belongs to, if known
+
+        Returns:
+            Matching table, or None if it is missing or ambiguous
+        """
+        table = self.tables_by_key.get((schema, name))
+        if table is None:
+            candidates = self.tables_by_name.get(name, ())
+            if len(candidates) == 1:
+                table = candidates[0]
+        return table
+
+    @classmethod
+    def from_dict(cls, schema_data: Dict[str, Any]) -> 'Schema':
+        """
+        Build a schema from the extractor JSON format.
+
+        Args:
+            schema_data: Parsed JSON database schema
+
+        Returns:
+            Schema instance
+        """
+        database_info = schema_data['database_info']
+        return cls(database_info['database_name'],
+                   database_info.get('database_type'),
+                   tuple(Table.from_dict(table) for table in schema_data['tables']))
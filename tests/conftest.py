@@ -3,9 +3,14 @@ import pytest
 import os
 import tempfile
 import shutil
+import sys
+
+# make the Python helpers in lib/ importable from the tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'lib')))
 
 # Shared constants
 SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'main.sh'))
+VISUALIZE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'visualize.py'))
 INVALID_CONFIGS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'config_examples/invalid_configs'))
 VALID_CONFIGS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'config_examples/valid_configs'))
 
@@ -22,6 +27,39 @@ MISSING_HOST = os.path.join(INVALID_CONFIGS_DIR, 'missing_host.json')
 MISSING_DB_LOCATION = os.path.join(INVALID_CONFIGS_DIR, 'missing_location_info.json')
 UNSUPPORTED_DB = os.path.join(INVALID_CONFIGS_DIR, 'unsupported_database.json')
 
+# Minimal extracted schema with one foreign key, in the format written by the extractors
+SAMPLE_SCHEMA = {
+    "database_info": {"database_name": "shop-db", "database_type": "postgres"},
+    "tables": [
+        {
+            "schema": "public",
+            "name": "customers",
+            "columns": [
+                {"column_name": "id", "data_type": "integer", "is_nullable": "NO"},
+                {"column_name": "email", "data_type": "character varying", "is_nullable": "YES"}
+            ],
+            "constraints": [
+                {"constraint_name": "customers_pkey", "constraint_type": "PRIMARY KEY", "column_name": "id",
+                 "foreign_table_schema": "public", "foreign_table_name": "customers", "foreign_column_name": "id"}
+            ]
+        },
+        {
+            "schema": "public",
+            "name": "orders",
+            "columns": [
+                {"column_name": "id", "data_type": "integer", "is_nullable": "NO"},
+                {"column_name": "customer_id", "data_type": "integer", "is_nullable": "NO"}
+            ],
+            "constraints": [
+                {"constraint_name": "orders_pkey", "constraint_type": "PRIMARY KEY", "column_name": "id",
+                 "foreign_table_schema": "public", "foreign_table_name": "orders", "foreign_column_name": "id"},
+                {"constraint_name": "orders_customer_fkey", "constraint_type": "FOREIGN KEY", "column_name": "customer_id",
+                 "foreign_table_schema": "public", "foreign_table_name": "customers", "foreign_column_name": "id"}
+            ]
+        }
+    ]
+}
+
 @pytest.fixture
 def mock_tools_env():
     """Create a temporary environment with mock tools"""
@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from conftest import VISUALIZE_PATH, SAMPLE_SCHEMA
+
+def render_viewer(tmp_path, env, schema_data):
+    """Run visualize.py with --html on schema_data and return the generated HTML"""
+    schema_file = tmp_path / 'shop_schema.json'
+    schema_file.write_text(json.dumps(schema_data))
+    html_file = tmp_path / 'ERD.html'
+    
+    result = subprocess.run(
+        [sys.executable, VISUALIZE_PATH, str(schema_file), str(tmp_path / 'erd.dot'), '--html', str(html_file)],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert os.path.exists(html_file)
+    return html_file.read_text()
+
+@pytest.fixture
+def html_viewer(tmp_path, mock_tools_env):
+    """Viewer HTML generated from the sample schema"""
+    return render_viewer(tmp_path, mock_tools_env, SAMPLE_SCHEMA)
+
+def extract_payload(html):
+    start = html.index('<script id="erd-data" type="application/json">')
+    start = html.index('>', start) + 1
+    return json.loads(html[start:html.index('</script>', start)])
+
+class TestHtmlViewer:
+    """Test the interactive HTML viewer generated by visualize.py"""
+    
+    def test_viewer_is_self_contained(self, html_viewer):
+        """Viewer should not load any external resources"""
+        assert '<title>shop-db ERD</title>' in html_viewer
+        assert 'src=' not in html_viewer
+        assert 'href=' not in html_viewer
+    
+    def test_payload_contains_tables_and_layout(self, html_viewer):
+        """Embedded payload should hold every table with non-overlapping coordinates"""
+        payload = extract_payload(html_viewer)
+        names = [table[0] for table in payload['tables']]
+        assert sorted(names) == ['customers', 'orders']
+        
+        (_, x1, y1, w1, h1, _), (_, x2, y2, w2, h2, _) = payload['tables']
+        assert x1 + w1 <= x2 or x2 + w2 <= x1 or y1 + h1 <= y2 or y2 + h2 <= y1
+    
+    def test_payload_encodes_keys_and_relationships(self, html_viewer):
+        """Columns should carry PK/FK flags and relationships should point at column indices"""
+        payload = extract_payload(html_viewer)
+        tables = {table[0]: index for index, table in enumerate(payload['tables'])}
+        customers = payload['tables'][tables['customers']]
+        orders = payload['tables'][tables['orders']]
+        
+        assert customers[5][0][2] & 1  # id is a primary key
+        assert orders[5][1][2] & 2     # customer_id is a foreign key
+        assert payload['edges'] == [[tables['orders'], 1, tables['customers'], 0]]
+    
+    def test_same_named_tables_keep_their_own_edges(self, tmp_path, mock_tools_env):
+        """Tables sharing a name across database schemas should not swap relationships"""
+        audit_orders = {"schema": "audit", "name": "orders", "columns": [], "constraints": []}
+        schema_data = dict(SAMPLE_SCHEMA, tables=SAMPLE_SCHEMA['tables'] + [audit_orders])
+        payload = extract_payload(render_viewer(tmp_path, mock_tools_env, schema_data))
+        
+        assert [table[0] for table in payload['tables']] == ['customers', 'orders', 'orders']
+        assert payload['edges'] == [[1, 1, 0, 0]]
+    
+    def test_edges_indexed_separately_from_tables(self, html_viewer):
+        """Every edge should be in the edge index so it can be drawn while both tables are off-screen"""
+        payload = extract_payload(html_viewer)
+        indexed = {index for level in payload['edge_tiles'] for bucket in level.values() for index in bucket}
+        assert indexed == set(range(len(payload['edges'])))
+    
+    def test_name_index_is_sorted(self, html_viewer):
+        """Search index should be sorted lowercase names for prefix lookups"""
+        payload = extract_payload(html_viewer)
+        assert [entry[0] for entry in payload['name_index']] == ['customers', 'orders']
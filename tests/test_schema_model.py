@@ -0,0 +1,73 @@
+import sys
+import pytest
+from schema_model import Schema, Table
+from conftest import SAMPLE_SCHEMA
+
+@pytest.fixture
+def schema():
+    """Schema model built from the sample schema"""
+    return Schema.from_dict(SAMPLE_SCHEMA)
+
+class TestSchemaModel:
+    """Test the indexed schema model built from extractor JSON"""
+    
+    def test_tables_indexed_by_name(self, schema):
+        """Tables should be reachable by name in schema order"""
+        assert [table.name for table in schema.tables] == ['customers', 'orders']
+        assert schema.tables_by_key[('public', 'orders')] is schema.tables[1]
+        assert schema.database_name == 'shop-db'
+    
+    def test_key_sets_precomputed(self, schema):
+        """Each table should expose its primary and foreign key column sets"""
+        orders = schema.find_table('orders')
+        assert orders.primary_keys == {'id'}
+        assert orders.foreign_keys == {'customer_id'}
+        assert schema.find_table('customers').foreign_keys == frozenset()
+    
+    def test_relationship_edges_linked_both_ways(self, schema):
+        """Relationships should appear in the outbound and inbound lists of their tables"""
+        customers = schema.find_table('customers')
+        orders = schema.find_table('orders')
+        
+        assert len(schema.relationships) == 1
+        relationship = schema.relationships[0]
+        assert orders.outbound == [relationship]
+        assert customers.inbound == [relationship]
+        assert relationship.to_table is customers
+        assert (relationship.from_column, relationship.to_column) == ('customer_id', 'id')
+    
+    def test_relationships_to_missing_tables_skipped(self):
+        """Foreign keys to tables outside the schema (e.g. excluded tables) should not create edges"""
+        data = {'database_info': SAMPLE_SCHEMA['database_info'], 'tables': [SAMPLE_SCHEMA['tables'][1]]}
+        schema = Schema.from_dict(data)
+        
+        assert schema.relationships == []
+        assert schema.tables[0].foreign_keys == {'customer_id'}
+    
+    def test_same_named_tables_resolved_by_schema(self):
+        """Tables sharing a name across database schemas should stay separate and be resolved by schema"""
+        audit_customers = {"schema": "audit", "name": "customers", "columns": [], "constraints": []}
+        data = dict(SAMPLE_SCHEMA, tables=[audit_customers] + SAMPLE_SCHEMA['tables'])
+        schema = Schema.from_dict(data)
+        public_customers = schema.tables_by_key[('public', 'customers')]
+        
+        assert [table.schema for table in schema.tables_by_name['customers']] == ['audit', 'public']
+        assert schema.find_table('customers') is None
+        assert schema.find_table('customers', 'audit') is schema.tables[0]
+        assert schema.relationships[0].to_table is public_customers
+        assert schema.tables[0].inbound == []
+    
+    def test_columns_indexed_and_interned(self, schema):
+        """Columns should be indexed by name with their position, and names interned"""
+        orders = schema.find_table('orders')
+        column = orders.columns_by_name['customer_id']
+        
+        assert column.position == 1
+        assert column.is_nullable is False
+        assert column.name is sys.intern('customer_id')
+        assert not hasattr(column, '__dict__')
+    
+    def test_table_round_trips_to_json_format(self):
+        """Table.to_dict should reproduce the extractor JSON format"""
+        table_data = SAMPLE_SCHEMA['tables'][1]
+        assert Table.from_dict(table_data).to_dict() == table_data
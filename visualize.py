@@ -1,29 +1,68 @@
 """
 JSON Database Schema to Graphviz DOT Generator
 
-Converts database schema JSON files to DOT format for ERD visualization.
-Usage: python visualize.py <schema.json> [output.dot]
+Converts database schema JSON files to DOT format for ERD visualization,
+and optionally to a self-contained interactive HTML viewer for large schemas.
+Usage: python visualize.py <schema.json> [output.dot] [--html [output.html]]
 """
 
 import json
+import math
 import sys
 import subprocess
 import argparse
+from collections import deque
+from html import escape
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
+# lib/ is a plain script directory rather than a package, so put it on
+# sys.path (as benchmarks/schema_model_memory.py does). Note that importing
+# this module therefore changes the global sys.path.
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'lib'))
 
-def generate_dot_from_database_schema(schema_data: Dict[str, Any]) -> str:
+from schema_model import Column, Schema, Table
+
+
+# Layout constants for the HTML viewer (in world units, roughly pixels at 100% zoom)
+HEADER_HEIGHT = 24
+ROW_HEIGHT = 18
+CHAR_WIDTH = 7
+MIN_TABLE_WIDTH = 120
+MAX_TABLE_WIDTH = 420
+TABLE_GAP = 60
+TILE_SIZE = 1024
+EDGE_BEND = 40
+
+# Column flag bits used in the compact viewer payload
+FLAG_PRIMARY_KEY = 1
+FLAG_FOREIGN_KEY = 2
+FLAG_NOT_NULL = 4
+
+
+# Map verbose types to cleaner display names
+TYPE_MAP = {
+    'character varying': 'string',
+    'varchar': 'string',
+    'text': 'string',
+    'integer': 'integer',
+    'boolean': 'boolean',
+    'timestamp with time zone': 'timestamptz',
+    'timestamptz': 'timestamptz'
+}
+
+
+def generate_dot_from_database_schema(schema: Schema) -> str:
     """
-    Generate DOT file content from database schema JSON.
+    Generate DOT file content from a database schema.
     
     Args:
-        schema_data: Parsed JSON database schema
+        schema: Database schema model
         
     Returns:
         DOT file content as string
     """
-    database_name = schema_data['database_info']['database_name'].replace('-', '_')  
+    database_name = schema.database_name.replace('-', '_')  
     
     dot_content = f"""digraph {database_name}ERD {{
     rankdir=TB;
@@ -36,23 +75,20 @@ def generate_dot_from_database_schema(schema_data: Dict[str, Any]) -> str:
     
 """
     
-    tables = [table for table in schema_data['tables'] ]
-
-    if len(tables) == 0:
+    if len(schema.tables) == 0:
         return None
     
     # Generate table definitions
-    for table in tables:
+    for table in schema.tables:
         dot_content += generate_table_definition(table)
         dot_content += '\n'
     
     # Generate relationships with specific column connections
     dot_content += '    // Relationships\n'
-    relationships = extract_relationships(tables)
-    for rel in relationships:
+    for rel in schema.relationships:
         # Connect from specific column to specific column using ports
-        from_port = f"{rel['from']}:{rel['column']}"
-        to_port = f"{rel['to']}:{rel['foreign_column']}"
+        from_port = f"{rel.from_table.name}:{rel.from_column}"
+        to_port = f"{rel.to_table.name}:{rel.to_column}"
         dot_content += f"    {from_port} -> {to_port};\n"
     
     dot_content += '}'
@@ -60,32 +96,29 @@ def generate_dot_from_database_schema(schema_data: Dict[str, Any]) -> str:
     return dot_content
 
 
-def generate_table_definition(table: Dict[str, Any]) -> str:
+def generate_table_definition(table: Table) -> str:
     """
     Generate DOT table definition with proper left-right column alignment.
     
     Args:
-        table: Table schema dictionary
+        table: Table schema model
         
     Returns:
         DOT table definition string
     """
-    table_name = table['name']
+    table_name = table.name
     
     table_html = f"""    {table_name} [label=<
         <TABLE BORDER="0" CELLBORDER="1" CELLSPACING="0">
             <TR><TD COLSPAN="2" BGCOLOR="steelblue" ALIGN="CENTER"><FONT COLOR="white"><B>{table_name}</B></FONT></TD></TR>"""
     
-    # Get primary key columns
-    primary_keys = get_primary_key_columns(table)
-    
-    for column in table['columns']:
-        column_name = column['column_name']
-        is_primary_key = column_name in primary_keys
+    for column in table.columns:
+        column_name = column.name
+        is_primary_key = column_name in table.primary_keys
         
         display_name = f"{column_name} (PK)" if is_primary_key else column_name
         data_type = format_data_type(column)
-        nullable = ' NN' if column['is_nullable'] == 'NO' else ''
+        nullable = '' if column.is_nullable else ' NN'
         
         # Use two columns: left for name, right for type/constraints
         type_info = f"{data_type}{nullable}"
@@ -99,79 +132,706 @@ def generate_table_definition(table: Dict[str, Any]) -> str:
     return table_html
 
 
-def get_primary_key_columns(table: Dict[str, Any]) -> List[str]:
+def format_data_type(column: Column) -> str:
     """
-    Extract primary key column names from table constraints.
+    Format database data types to cleaner display names.
     
     Args:
-        table: Table schema dictionary
+        column: Column schema model
         
     Returns:
-        List of primary key column names
+        Formatted data type string
     """
-    primary_keys = []
-    for constraint in table['constraints']:
-        if (constraint['constraint_type'] == 'PRIMARY KEY' and 
-            constraint['column_name']):
-            primary_keys.append(constraint['column_name'])
-    return primary_keys
+    return TYPE_MAP.get(column.data_type, column.data_type)
 
 
-def format_data_type(column: Dict[str, Any]) -> str:
+def estimate_table_size(table: Table) -> Tuple[int, int]:
     """
-    Format database data types to cleaner display names.
+    Estimate the on-screen size of a table box in the HTML viewer.
     
     Args:
-        column: Column schema dictionary
+        table: Table schema model
         
     Returns:
-        Formatted data type string
+        Tuple of (width, height) in world units
     """
-    data_type = column['data_type']
-    
-    # Map verbose types to cleaner names
-    type_map = {
-        'character varying': 'string',
-        'varchar': 'string',
-        'text': 'string',
-        'integer': 'integer',
-        'boolean': 'boolean',
-        'timestamp with time zone': 'timestamptz',
-        'timestamptz': 'timestamptz'
-    }
+    longest = len(table.name) + 2
+    for column in table.columns:
+        longest = max(longest, len(column.name) + len(format_data_type(column)) + 6)
     
-    return type_map.get(data_type, data_type)
+    width = min(MAX_TABLE_WIDTH, max(MIN_TABLE_WIDTH, longest * CHAR_WIDTH + 16))
+    height = HEADER_HEIGHT + ROW_HEIGHT * len(table.columns)
+    return width, height
 
 
-def extract_relationships(tables: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+def compute_table_layout(schema: Schema) -> List[Tuple[int, int, int, int]]:
     """
-    Extract foreign key relationships between tables.
+    Precompute table positions for the HTML viewer.
+    
+    Tables are ordered by a breadth-first walk over the relationship graph,
+    starting from the most connected table of each component, so related
+    tables end up near each other. They are then shelf-packed into rows that
+    give a roughly square overall diagram. This runs in O(n log n) and stays
+    fast for schemas with thousands of tables, unlike a full Graphviz layout.
     
     Args:
-        tables: List of table schema dictionaries
+        schema: Database schema model
         
     Returns:
-        List of relationship dictionaries
+        List of (x, y, width, height) tuples, in the same order as schema.tables
     """
-    relationships = []
-    table_names = {table['name'] for table in tables}
-    
-    for table in tables:
-        for constraint in table['constraints']:
-            if constraint['constraint_type'] == 'FOREIGN KEY':
-                from_table = table['name']
-                to_table = constraint['foreign_table_name']
-                
-                # Only add if both tables exist in our filtered list
-                if to_table in table_names:
-                    relationships.append({
-                        'from': from_table,
-                        'to': to_table,
-                        'column': constraint['column_name'],
-                        'foreign_column': constraint['foreign_column_name']
-                    })
-    
-    return relationships
+    tables = schema.tables
+    # Keyed by identity, as table names are only unique within a database schema
+    index_by_table = {id(table): i for i, table in enumerate(tables)}
+    neighbours = [
+        [index_by_table[id(rel.to_table)] for rel in table.outbound] +
+        [index_by_table[id(rel.from_table)] for rel in table.inbound]
+        for table in tables
+    ]
+    
+    # Walk each connected component from its most connected table
+    order = []
+    visited = [False] * len(tables)
+    by_degree = sorted(range(len(tables)), key=lambda i: -len(neighbours[i]))
+    for start in by_degree:
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for neighbour in neighbours[current]:
+                if not visited[neighbour]:
+                    visited[neighbour] = True
+                    queue.append(neighbour)
+    
+    sizes = [estimate_table_size(table) for table in tables]
+    total_area = sum((w + TABLE_GAP) * (h + TABLE_GAP) for w, h in sizes)
+    row_width = max(max(w for w, _ in sizes), int(math.sqrt(total_area) * 1.3))
+    
+    # Shelf-pack tables into rows
+    positions = [None] * len(tables)
+    x = y = row_height = 0
+    for i in order:
+        width, height = sizes[i]
+        if x > 0 and x + width > row_width:
+            x = 0
+            y += row_height + TABLE_GAP
+            row_height = 0
+        positions[i] = (x, y, width, height)
+        x += width + TABLE_GAP
+        row_height = max(row_height, height)
+    
+    return positions
+
+
+def build_tile_index(positions: List[Tuple[int, int, int, int]]) -> Dict[str, List[int]]:
+    """
+    Bucket tables into fixed-size tiles so the viewer only draws what is on screen.
+    
+    Args:
+        positions: Table positions from compute_table_layout
+        
+    Returns:
+        Dictionary mapping "tile_x,tile_y" keys to lists of table indices
+    """
+    tiles = {}
+    for i, (x, y, width, height) in enumerate(positions):
+        for tile_x in range(x // TILE_SIZE, (x + width) // TILE_SIZE + 1):
+            for tile_y in range(y // TILE_SIZE, (y + height) // TILE_SIZE + 1):
+                tiles.setdefault(f"{tile_x},{tile_y}", []).append(i)
+    return tiles
+
+
+def compute_edge_bounds(positions: List[Tuple[int, int, int, int]],
+                        edge: List[int]) -> Tuple[float, float, float, float]:
+    """
+    Compute a bounding box that contains the curve the viewer draws for an edge.
+    
+    Args:
+        positions: Table positions from compute_table_layout
+        edge: Encoded edge [from_table, from_column, to_table, to_column]
+        
+    Returns:
+        Tuple of (left, top, right, bottom) in world units
+    """
+    def anchor_y(position, column):
+        y = position[1]
+        return y + HEADER_HEIGHT / 2 if column < 0 else y + HEADER_HEIGHT + (column + 0.5) * ROW_HEIGHT
+    
+    from_position = positions[edge[0]]
+    to_position = positions[edge[2]]
+    from_y = anchor_y(from_position, edge[1])
+    to_y = anchor_y(to_position, edge[3])
+    
+    # The bezier control points never reach further than EDGE_BEND past either table
+    left = min(from_position[0], to_position[0]) - EDGE_BEND
+    right = max(from_position[0] + from_position[2], to_position[0] + to_position[2]) + EDGE_BEND
+    return left, min(from_y, to_y), right, max(from_y, to_y)
+
+
+def build_edge_index(bounds: List[Tuple[float, float, float, float]]) -> List[Dict[str, List[int]]]:
+    """
+    Bucket edges into a loose quadtree so edges crossing the viewport are drawn
+    even when neither of their tables is on screen.
+    
+    Level n uses tiles of TILE_SIZE * 2**n, and each edge is stored at the
+    lowest level where its bounding box spans at most 2x2 tiles. This keeps
+    long edges from being copied into hundreds of small tiles.
+    
+    Args:
+        bounds: Edge bounding boxes from compute_edge_bounds
+        
+    Returns:
+        List of dictionaries, one per level, mapping "tile_x,tile_y" keys to
+        lists of edge indices
+    """
+    levels = []
+    for i, (left, top, right, bottom) in enumerate(bounds):
+        level = 0
+        size = TILE_SIZE
+        while right // size - left // size > 1 or bottom // size - top // size > 1:
+            level += 1
+            size *= 2
+        while len(levels) <= level:
+            levels.append({})
+        for tile_x in range(int(left // size), int(right // size) + 1):
+            for tile_y in range(int(top // size), int(bottom // size) + 1):
+                levels[level].setdefault(f"{tile_x},{tile_y}", []).append(i)
+    return levels
+
+
+def build_viewer_payload(schema: Schema) -> Optional[Dict[str, Any]]:
+    """
+    Build the compact JSON payload embedded in the HTML viewer.
+    
+    Tables are encoded as [name, x, y, width, height, columns] and columns as
+    [name, type_index, flags], with data types interned into a shared list.
+    Relationships are encoded as [from_table, from_column, to_table, to_column]
+    indices, where a column index of -1 means the column is not in the table.
+    Tables and edges are indexed separately so each can be culled on its own.
+    
+    Args:
+        schema: Database schema model
+        
+    Returns:
+        Payload dictionary, or None if the schema has no tables
+    """
+    tables = schema.tables
+    if len(tables) == 0:
+        return None
+    
+    positions = compute_table_layout(schema)
+    index_by_table = {id(table): i for i, table in enumerate(tables)}
+    
+    types = []
+    type_indexes = {}
+    encoded_tables = []
+    for table, (x, y, width, height) in zip(tables, positions):
+        encoded_columns = []
+        for column in table.columns:
+            data_type = format_data_type(column)
+            if data_type not in type_indexes:
+                type_indexes[data_type] = len(types)
+                types.append(data_type)
+            
+            flags = 0
+            if column.name in table.primary_keys:
+                flags |= FLAG_PRIMARY_KEY
+            if column.name in table.foreign_keys:
+                flags |= FLAG_FOREIGN_KEY
+            if not column.is_nullable:
+                flags |= FLAG_NOT_NULL
+            encoded_columns.append([column.name, type_indexes[data_type], flags])
+        
+        encoded_tables.append([table.name, x, y, width, height, encoded_columns])
+    
+    edges = []
+    for rel in schema.relationships:
+        from_column = rel.from_table.columns_by_name.get(rel.from_column)
+        to_column = rel.to_table.columns_by_name.get(rel.to_column)
+        edges.append([
+            index_by_table[id(rel.from_table)],
+            from_column.position if from_column else -1,
+            index_by_table[id(rel.to_table)],
+            to_column.position if to_column else -1
+        ])
+    
+    name_index = sorted([table.name.lower(), i] for i, table in enumerate(tables))
+    
+    return {
+        'database_name': schema.database_name,
+        'width': max(x + w for x, _, w, _ in positions),
+        'height': max(y + h for _, y, _, h in positions),
+        'header_height': HEADER_HEIGHT,
+        'row_height': ROW_HEIGHT,
+        'tile_size': TILE_SIZE,
+        'edge_bend': EDGE_BEND,
+        'types': types,
+        'tables': encoded_tables,
+        'edges': edges,
+        'tiles': build_tile_index(positions),
+        'edge_tiles': build_edge_index([compute_edge_bounds(positions, edge) for edge in edges]),
+        'name_index': name_index
+    }
+
+
+HTML_VIEWER_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>__ERD_TITLE__ ERD</title>
+<style>
+html, body { margin: 0; height: 100%; overflow: hidden; font-family: Arial, sans-serif; font-size: 12px; background: #fafafa; }
+#erd-canvas { position: absolute; top: 0; left: 0; cursor: grab; }
+#erd-canvas.dragging { cursor: grabbing; }
+#erd-toolbar { position: absolute; top: 8px; left: 8px; width: 260px; background: #fff; border: 1px solid #ccc; box-shadow: 0 1px 4px rgba(0, 0, 0, .2); }
+#erd-search { box-sizing: border-box; width: 100%; padding: 6px; border: 0; font-size: 13px; }
+#erd-results { list-style: none; margin: 0; padding: 0; max-height: 240px; overflow-y: auto; border-top: 1px solid #ccc; }
+#erd-results:empty { display: none; }
+#erd-results li { padding: 4px 6px; cursor: pointer; }
+#erd-results li.active, #erd-results li:hover { background: steelblue; color: #fff; }
+#erd-details { position: absolute; top: 8px; right: 8px; width: 320px; max-height: calc(100% - 16px); overflow-y: auto; background: #fff; border: 1px solid #ccc; box-shadow: 0 1px 4px rgba(0, 0, 0, .2); display: none; }
+#erd-details table { border-collapse: collapse; width: 100%; }
+#erd-details th { background: steelblue; color: #fff; padding: 6px; }
+#erd-details td { border-top: 1px solid #ddd; padding: 3px 6px; vertical-align: top; }
+#erd-details a { color: steelblue; cursor: pointer; }
+#erd-details .erd-muted { color: #777; }
+#erd-status { position: absolute; bottom: 8px; left: 8px; padding: 2px 6px; color: #555; background: rgba(255, 255, 255, .8); }
+</style>
+</head>
+<body>
+<canvas id="erd-canvas"></canvas>
+<div id="erd-toolbar">
+<input id="erd-search" type="search" placeholder="Search tables..." autocomplete="off" spellcheck="false">
+<ul id="erd-results"></ul>
+</div>
+<div id="erd-details"></div>
+<div id="erd-status"></div>
+<script id="erd-data" type="application/json">__ERD_DATA__</script>
+<script>
+(function () {
+    "use strict";
+
+    var data = JSON.parse(document.getElementById("erd-data").textContent);
+    var tables = data.tables;          // [name, x, y, width, height, columns]
+    var edges = data.edges;            // [from_table, from_column, to_table, to_column]
+    var types = data.types;
+    var tiles = data.tiles;            // "tile_x,tile_y" -> table indices
+    var edgeTiles = data.edge_tiles;   // per level: "tile_x,tile_y" -> edge indices
+    var nameIndex = data.name_index;   // [lowercase name, table index], sorted
+    var TILE = data.tile_size, HEADER = data.header_height, ROW = data.row_height, BEND = data.edge_bend;
+    var FLAG_PK = 1, FLAG_FK = 2, FLAG_NN = 4;
+    var MAX_RESULTS = 50;
+
+    // Per-table edge lists for the details panel
+    var outbound = [], inbound = [];
+    for (var t = 0; t < tables.length; t++) { outbound.push([]); inbound.push([]); }
+    edges.forEach(function (edge, i) { outbound[edge[0]].push(i); inbound[edge[2]].push(i); });
+
+    var canvas = document.getElementById("erd-canvas");
+    var ctx = canvas.getContext("2d");
+    var searchBox = document.getElementById("erd-search");
+    var resultList = document.getElementById("erd-results");
+    var details = document.getElementById("erd-details");
+    var status = document.getElementById("erd-status");
+
+    var view = { scale: 1, x: 0, y: 0 };
+    var width = 0, height = 0, ratio = 1;
+    var selected = -1, pending = false;
+    var tableStamp = new Uint32Array(tables.length), edgeStamp = new Uint32Array(edges.length), stamp = 0;
+
+    function resize() {
+        ratio = window.devicePixelRatio || 1;
+        width = window.innerWidth;
+        height = window.innerHeight;
+        canvas.width = width * ratio;
+        canvas.height = height * ratio;
+        canvas.style.width = width + "px";
+        canvas.style.height = height + "px";
+        requestDraw();
+    }
+
+    function requestDraw() {
+        if (!pending) {
+            pending = true;
+            window.requestAnimationFrame(draw);
+        }
+    }
+
+    function nextStamp() {
+        stamp += 1;
+        if (stamp === 0xffffffff) {
+            tableStamp.fill(0);
+            edgeStamp.fill(0);
+            stamp = 1;
+        }
+        return stamp;
+    }
+
+    // Collect the tables overlapping a world-space rectangle via the tile index
+    function tablesIn(left, top, right, bottom) {
+        var result = [], mark = nextStamp();
+        var tx0 = Math.floor(left / TILE), tx1 = Math.floor(right / TILE);
+        var ty0 = Math.floor(top / TILE), ty1 = Math.floor(bottom / TILE);
+        if ((tx1 - tx0 + 1) * (ty1 - ty0 + 1) > tables.length) {
+            for (var i = 0; i < tables.length; i++) {
+                if (overlaps(tables[i], left, top, right, bottom)) { result.push(i); }
+            }
+            return result;
+        }
+        for (var tx = tx0; tx <= tx1; tx++) {
+            for (var ty = ty0; ty <= ty1; ty++) {
+                var bucket = tiles[tx + "," + ty];
+                if (!bucket) { continue; }
+                for (var k = 0; k < bucket.length; k++) {
+                    var index = bucket[k];
+                    if (tableStamp[index] !== mark && overlaps(tables[index], left, top, right, bottom)) {
+                        tableStamp[index] = mark;
+                        result.push(index);
+                    }
+                }
+            }
+        }
+        return result;
+    }
+
+    // Collect the edges whose bounding boxes may overlap a world-space rectangle,
+    // checking each level of the edge index with its own tile size
+    function edgesIn(left, top, right, bottom) {
+        var result = [], mark = nextStamp();
+        for (var level = 0; level < edgeTiles.length; level++) {
+            var size = TILE * Math.pow(2, level), buckets = edgeTiles[level];
+            var tx0 = Math.floor(left / size), tx1 = Math.floor(right / size);
+            var ty0 = Math.floor(top / size), ty1 = Math.floor(bottom / size);
+            var keys = [];
+            if ((tx1 - tx0 + 1) * (ty1 - ty0 + 1) > edges.length) {
+                keys = Object.keys(buckets);
+            } else {
+                for (var tx = tx0; tx <= tx1; tx++) {
+                    for (var ty = ty0; ty <= ty1; ty++) { keys.push(tx + "," + ty); }
+                }
+            }
+            for (var k = 0; k < keys.length; k++) {
+                var bucket = buckets[keys[k]];
+                if (!bucket) { continue; }
+                for (var b = 0; b < bucket.length; b++) {
+                    var index = bucket[b];
+                    if (edgeStamp[index] !== mark) {
+                        edgeStamp[index] = mark;
+                        if (edgeOverlaps(edges[index], left, top, right, bottom)) { result.push(index); }
+                    }
+                }
+            }
+        }
+        return result;
+    }
+
+    // Same bounding box as compute_edge_bounds in visualize.py
+    function edgeOverlaps(edge, left, top, right, bottom) {
+        var from = tables[edge[0]], to = tables[edge[2]];
+        var y1 = anchorY(from, edge[1]), y2 = anchorY(to, edge[3]);
+        return Math.min(from[1], to[1]) - BEND <= right && Math.max(from[1] + from[3], to[1] + to[3]) + BEND >= left &&
+            Math.min(y1, y2) <= bottom && Math.max(y1, y2) >= top;
+    }
+
+    function overlaps(table, left, top, right, bottom) {
+        return table[1] <= right && table[1] + table[3] >= left && table[2] <= bottom && table[2] + table[4] >= top;
+    }
+
+    function anchorY(table, column) {
+        return column < 0 ? table[2] + HEADER / 2 : table[2] + HEADER + (column + 0.5) * ROW;
+    }
+
+    function drawEdge(edge) {
+        var from = tables[edge[0]], to = tables[edge[2]];
+        var y1 = anchorY(from, edge[1]), y2 = anchorY(to, edge[3]);
+        var x1, x2, bend;
+        if (edge[0] === edge[2]) {
+            x1 = x2 = from[1] + from[3];
+            bend = BEND;
+        } else if (from[1] + from[3] / 2 <= to[1] + to[3] / 2) {
+            x1 = from[1] + from[3];
+            x2 = to[1];
+            bend = Math.max(BEND, (x2 - x1) / 2);
+        } else {
+            x1 = from[1];
+            x2 = to[1] + to[3];
+            bend = -Math.max(BEND, (x1 - x2) / 2);
+        }
+        ctx.moveTo(x1, y1);
+        ctx.bezierCurveTo(x1 + bend, y1, x2 - (edge[0] === edge[2] ? -bend : bend), y2, x2, y2);
+    }
+
+    function drawTable(index, showText, showColumns) {
+        var table = tables[index], x = table[1], y = table[2], w = table[3], h = table[4];
+        ctx.fillStyle = "#fff";
+        ctx.fillRect(x, y, w, h);
+        ctx.fillStyle = "steelblue";
+        ctx.fillRect(x, y, w, HEADER);
+        ctx.strokeStyle = index === selected ? "darkorange" : "#888";
+        ctx.lineWidth = (index === selected ? 3 : 1) / view.scale;
+        ctx.strokeRect(x, y, w, h);
+        if (!showText) { return; }
+
+        ctx.save();
+        ctx.beginPath();
+        ctx.rect(x, y, w, h);
+        ctx.clip();
+        ctx.fillStyle = "#fff";
+        ctx.font = "bold 12px Arial";
+        ctx.textAlign = "center";
+        ctx.fillText(table[0], x + w / 2, y + HEADER / 2);
+        if (showColumns) {
+            var columns = table[5];
+            ctx.font = "11px Arial";
+            for (var c = 0; c < columns.length; c++) {
+                var column = columns[c], rowY = y + HEADER + c * ROW;
+                var flags = column[2];
+                ctx.strokeStyle = "#ddd";
+                ctx.lineWidth = 1 / view.scale;
+                ctx.beginPath();
+                ctx.moveTo(x, rowY);
+                ctx.lineTo(x + w, rowY);
+                ctx.stroke();
+                ctx.fillStyle = "#222";
+                ctx.textAlign = "left";
+                ctx.fillText(column[0] + (flags & FLAG_PK ? " (PK)" : ""), x + 6, rowY + ROW / 2);
+                ctx.fillStyle = "#666";
+                ctx.textAlign = "right";
+                ctx.fillText(types[column[1]] + (flags & FLAG_NN ? " NN" : ""), x + w - 6, rowY + ROW / 2);
+            }
+        }
+        ctx.restore();
+    }
+
+    function draw() {
+        pending = false;
+        ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        ctx.clearRect(0, 0, width, height);
+        ctx.setTransform(ratio * view.scale, 0, 0, ratio * view.scale, ratio * view.x, ratio * view.y);
+        ctx.textBaseline = "middle";
+
+        var left = -view.x / view.scale, top = -view.y / view.scale;
+        var visible = tablesIn(left, top, left + width / view.scale, top + height / view.scale);
+
+        // Level of detail: boxes only when zoomed far out, columns only when readable
+        var showText = view.scale >= 0.3;
+        var showColumns = view.scale >= 0.6;
+        var showEdges = view.scale >= 0.15 || visible.length < 500;
+
+        if (showEdges) {
+            var visibleEdges = edgesIn(left, top, left + width / view.scale, top + height / view.scale);
+            ctx.beginPath();
+            for (var e = 0; e < visibleEdges.length; e++) {
+                drawEdge(edges[visibleEdges[e]]);
+            }
+            ctx.strokeStyle = "#999";
+            ctx.lineWidth = 1 / view.scale;
+            ctx.stroke();
+        }
+
+        for (var v = 0; v < visible.length; v++) {
+            drawTable(visible[v], showText, showColumns);
+        }
+        status.textContent = visible.length + " of " + tables.length + " tables in view, zoom " + Math.round(view.scale * 100) + "%";
+    }
+
+    function zoomAt(screenX, screenY, factor) {
+        var scale = Math.min(4, Math.max(0.01, view.scale * factor));
+        view.x = screenX - (screenX - view.x) * (scale / view.scale);
+        view.y = screenY - (screenY - view.y) * (scale / view.scale);
+        view.scale = scale;
+        requestDraw();
+    }
+
+    function fitToView() {
+        view.scale = Math.min(1, 0.95 * Math.min(width / data.width, height / data.height));
+        view.x = (width - data.width * view.scale) / 2;
+        view.y = (height - data.height * view.scale) / 2;
+        requestDraw();
+    }
+
+    function jumpTo(index) {
+        var table = tables[index];
+        view.scale = Math.max(view.scale, 1);
+        view.x = width / 2 - (table[1] + table[3] / 2) * view.scale;
+        view.y = height / 2 - (table[2] + Math.min(table[4], height / 2) / 2) * view.scale;
+        select(index);
+    }
+
+    function tableAt(screenX, screenY) {
+        var x = (screenX - view.x) / view.scale, y = (screenY - view.y) / view.scale;
+        var hits = tablesIn(x, y, x, y);
+        return hits.length ? hits[hits.length - 1] : -1;
+    }
+
+    function link(index) {
+        return '<a data-table="' + index + '">' + escapeHtml(tables[index][0]) + "</a>";
+    }
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, function (ch) {
+            return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[ch];
+        });
+    }
+
+    // Column details are only built for the table the user selects
+    function select(index) {
+        selected = index;
+        requestDraw();
+        if (index < 0) {
+            details.style.display = "none";
+            return;
+        }
+        var table = tables[index], references = {};
+        outbound[index].forEach(function (edgeIndex) {
+            var edge = edges[edgeIndex];
+            var target = tables[edge[2]];
+            references[edge[1]] = link(edge[2]) + (edge[3] >= 0 ? "." + escapeHtml(target[5][edge[3]][0]) : "");
+        });
+        var html = '<table><tr><th colspan="3">' + escapeHtml(table[0]) + "</th></tr>";
+        table[5].forEach(function (column, c) {
+            var flags = column[2], notes = [];
+            if (flags & FLAG_PK) { notes.push("PK"); }
+            if (flags & FLAG_NN) { notes.push("NN"); }
+            if (flags & FLAG_FK) { notes.push("FK" + (references[c] ? " &rarr; " + references[c] : "")); }
+            html += "<tr><td>" + escapeHtml(column[0]) + '</td><td class="erd-muted">' + escapeHtml(types[column[1]]) + "</td><td>" + notes.join(", ") + "</td></tr>";
+        });
+        var referencedBy = {};
+        inbound[index].forEach(function (edgeIndex) { referencedBy[edges[edgeIndex][0]] = true; });
+        var sources = Object.keys(referencedBy);
+        if (sources.length) {
+            html += '<tr><td colspan="3"><span class="erd-muted">Referenced by:</span> ' + sources.map(function (source) { return link(+source); }).join(", ") + "</td></tr>";
+        }
+        details.innerHTML = html + "</table>";
+        details.style.display = "block";
+    }
+
+    // Prefix matches come from a binary search over the sorted name index;
+    // substring matches fill any remaining result slots
+    function search(query) {
+        var results = [], seen = {};
+        query = query.trim().toLowerCase();
+        if (!query) { return results; }
+        var low = 0, high = nameIndex.length;
+        while (low < high) {
+            var mid = (low + high) >> 1;
+            if (nameIndex[mid][0] < query) { low = mid + 1; } else { high = mid; }
+        }
+        for (var i = low; i < nameIndex.length && results.length < MAX_RESULTS && nameIndex[i][0].lastIndexOf(query, 0) === 0; i++) {
+            results.push(nameIndex[i][1]);
+            seen[nameIndex[i][1]] = true;
+        }
+        for (var j = 0; j < nameIndex.length && results.length < MAX_RESULTS; j++) {
+            if (!seen[nameIndex[j][1]] && nameIndex[j][0].indexOf(query) > 0) {
+                results.push(nameIndex[j][1]);
+            }
+        }
+        return results;
+    }
+
+    var results = [], activeResult = 0;
+
+    function renderResults() {
+        resultList.innerHTML = results.map(function (index, i) {
+            return '<li data-table="' + index + '"' + (i === activeResult ? ' class="active"' : "") + ">" + escapeHtml(tables[index][0]) + "</li>";
+        }).join("");
+    }
+
+    searchBox.addEventListener("input", function () {
+        results = search(searchBox.value);
+        activeResult = 0;
+        renderResults();
+    });
+
+    searchBox.addEventListener("keydown", function (event) {
+        if (event.key === "ArrowDown" || event.key === "ArrowUp") {
+            if (results.length) {
+                activeResult = (activeResult + (event.key === "ArrowDown" ? 1 : results.length - 1)) % results.length;
+                renderResults();
+            }
+            event.preventDefault();
+        } else if (event.key === "Enter" && results.length) {
+            jumpTo(results[activeResult]);
+        } else if (event.key === "Escape") {
+            searchBox.value = "";
+            results = [];
+            renderResults();
+        }
+    });
+
+    function onLinkClick(event) {
+        var index = event.target.getAttribute("data-table");
+        if (index !== null) { jumpTo(+index); }
+    }
+    resultList.addEventListener("click", onLinkClick);
+    details.addEventListener("click", onLinkClick);
+
+    var drag = null;
+    canvas.addEventListener("mousedown", function (event) {
+        drag = { x: event.clientX, y: event.clientY, moved: false };
+        canvas.classList.add("dragging");
+    });
+    window.addEventListener("mousemove", function (event) {
+        if (!drag) { return; }
+        var dx = event.clientX - drag.x, dy = event.clientY - drag.y;
+        if (Math.abs(dx) + Math.abs(dy) > 2) { drag.moved = true; }
+        view.x += dx;
+        view.y += dy;
+        drag.x = event.clientX;
+        drag.y = event.clientY;
+        requestDraw();
+    });
+    window.addEventListener("mouseup", function (event) {
+        if (drag && !drag.moved && event.target === canvas) {
+            select(tableAt(event.clientX, event.clientY));
+        }
+        drag = null;
+        canvas.classList.remove("dragging");
+    });
+    canvas.addEventListener("wheel", function (event) {
+        event.preventDefault();
+        zoomAt(event.clientX, event.clientY, Math.exp(-event.deltaY * 0.002));
+    }, { passive: false });
+    canvas.addEventListener("dblclick", fitToView);
+    window.addEventListener("resize", resize);
+
+    resize();
+    fitToView();
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def generate_html_viewer(schema: Schema) -> Optional[str]:
+    """
+    Generate a self-contained interactive HTML viewer from a database schema.
+    
+    The viewer only draws tables inside the current viewport, searches through
+    a prebuilt name index and builds column details on demand, so it stays
+    responsive for schemas far too large for a static PNG.
+    
+    Args:
+        schema: Database schema model
+        
+    Returns:
+        HTML file content as string, or None if the schema has no tables
+    """
+    payload = build_viewer_payload(schema)
+    if payload is None:
+        return None
+    
+    # '<' can only occur inside JSON strings, so escaping it is lossless and
+    # stops table names such as "</script>" from closing the data block early
+    data = json.dumps(payload, separators=(',', ':')).replace('<', '\\u003c')
+    
+    return (HTML_VIEWER_TEMPLATE
+            .replace('__ERD_TITLE__', escape(payload['database_name']))
+            .replace('__ERD_DATA__', data))
 
 
 def load_schema_file(file_path: str) -> Dict[str, Any]:
@@ -196,12 +856,12 @@ def load_schema_file(file_path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
-def save_dot_file(content: str, output_path: str) -> None:
+def save_text_file(content: str, output_path: str) -> None:
     """
-    Save DOT content to file.
+    Save generated DOT or HTML content to file.
     
     Args:
-        content: DOT file content
+        content: File content
         output_path: Output file path
     """
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -219,16 +879,19 @@ def main():
                        help='Output DOT file (default: database_erd.dot)')
     parser.add_argument('--png', action='store_true',
                        help='Also generate PNG using dot command')
+    parser.add_argument('--html', nargs='?', const='ERD.html', default=None,
+                       metavar='HTML_FILE',
+                       help='Also generate an interactive HTML viewer (default: ERD.html)')
     
     args = parser.parse_args()
     
     try:
         # Load and process schema
-        schema_data = load_schema_file(args.input_file)
+        schema = Schema.from_dict(load_schema_file(args.input_file))
         
         # Generate DOT content
         print("Generating DOT content...")
-        dot_content = generate_dot_from_database_schema(schema_data)
+        dot_content = generate_dot_from_database_schema(schema)
 
         if dot_content is None:
             print("No tables could be found")
@@ -236,7 +899,12 @@ def main():
             sys.exit(2)
         
         # Save DOT file
-        save_dot_file(dot_content, args.output_file)
+        save_text_file(dot_content, args.output_file)
+        
+        # generate interactive HTML viewer
+        if args.html:
+            save_text_file(generate_html_viewer(schema), args.html)
+            print(f"Generated HTML viewer: {args.html}")
         
         #  generate PNG
         png_file = args.output_file.replace('.dot', '.png')